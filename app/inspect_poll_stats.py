@@ -1,42 +1,161 @@
-import json
-import glob
-from pathlib import Path
-from datetime import datetime
+import os
+import sys
+import numpy as np
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 
-ROOT = Path(".outputs/logs")
+ROOT = os.path.join(".outputs", "logs")
+TAIL_ROWS = 50
 
-def load_stats():
-    rows = []
-    for venue_dir in ROOT.iterdir():
+
+def _stat_files() -> list[str]:
+    """
+    Collect <venue>/poll_stats/date=*/poll_stats.part-*.jsonl paths.
+
+    Walks the fixed layout level by level with os.scandir (file type comes
+    from the directory read) rather than pathlib glob matching.
+    """
+    files = []
+    for venue_dir in os.scandir(ROOT):
         if not venue_dir.is_dir():
             continue
-        for f in venue_dir.glob("poll_stats/date=*/poll_stats.part-*.jsonl"):
-            with open(f) as fh:
-                for line in fh:
-                    try:
-                        rows.append(json.loads(line))
-                    except Exception:
-                        pass
-    return rows
-
-rows = load_stats()
-
-# sort by time
-rows.sort(key=lambda r: r.get("ts_ms", 0))
-
-print(f"Loaded {len(rows)} stats records\n")
-
-# pretty print recent history
-for r in rows[-50:]:
-    t = datetime.utcfromtimestamp(r["ts_ms"] / 1000).strftime("%H:%M:%S")
-    print(
-        f"{t}  {r['venue']:<11}  "
-        f"ok={r['successes']:>3}  "
-        f"fail={r['failures']:>3}  "
-        f"429={r['http_429']:>3}  "
-        f"to={r['timeouts']:>3}  "
-        f"p50={r['lat_p50_ms'] or '-':>4}ms  "
-        f"p95={r['lat_p95_ms'] or '-':>4}ms  "
-        f"cooldown={r['cooldown_remaining_s']:>4.0f}s  "
-        f"inflight={r['max_inflight']:>2}"
-    )
+        stats_dir = os.path.join(venue_dir.path, "poll_stats")
+        if not os.path.isdir(stats_dir):
+            continue
+        for date_dir in os.scandir(stats_dir):
+            if not (date_dir.name.startswith("date=") and date_dir.is_dir()):
+                continue
+            for f in os.scandir(date_dir.path):
+                name = f.name
+                if name.startswith("poll_stats.part-") and name.endswith(".jsonl"):
+                    files.append(f.path)
+    return files
+
+
+# Only the columns the report prints; everything else in a record is ignored.
+COLUMNS = (
+    "ts_ms",
+    "venue",
+    "successes",
+    "failures",
+    "http_429",
+    "timeouts",
+    "lat_p50_ms",
+    "lat_p95_ms",
+    "cooldown_remaining_s",
+    "max_inflight",
+)
+
+# Built once at import: pulls every COLUMNS field out of a record in a single
+# C call (records written by the poller always carry all of them).
+_extract_row = itemgetter(*COLUMNS)
+
+
+# Fill-ins for fields missing from older-schema records; chosen so the report
+# formatting below (":<11", ":>3", ":>4.0f", ...) still works on them.
+# lat_p50_ms/lat_p95_ms stay None: the report prints those as "-".
+_SLOW_DEFAULTS = {
+    "ts_ms": None,
+    "venue": "?",
+    "successes": 0,
+    "failures": 0,
+    "http_429": 0,
+    "timeouts": 0,
+    "lat_p50_ms": None,
+    "lat_p95_ms": None,
+    "cooldown_remaining_s": 0.0,
+    "max_inflight": 0,
+}
+
+
+def _extract_row_slow(r: dict) -> tuple:
+    """Fallback for records missing some fields (older schema versions)."""
+    return tuple(r.get(c, _SLOW_DEFAULTS[c]) for c in COLUMNS)
+
+
+def _parse_file(f: str) -> dict[str, list]:
+    """
+    Parse one poll_stats part file (runs in a worker process).
+
+    Returns column lists (one per COLUMNS entry) rather than a list of dicts:
+    far fewer objects to pickle back to the parent and to keep alive.
+    """
+    rows = []
+    rows_append = rows.append
+    loads = orjson.loads
+    # binary mode: orjson parses bytes directly (no utf-8 decode pass).
+    # One read per file, then split on b"\n" instead of per-line readline.
+    with open(f, "rb") as fh:
+        data = fh.read()
+    for line in data.split(b"\n"):
+        if not line:
+            continue
+        try:
+            r = loads(line)
+            rows_append(_extract_row(r))
+        except KeyError:
+            rows_append(_extract_row_slow(r))
+        except Exception:
+            continue
+
+    if not rows:
+        return {c: [] for c in COLUMNS}
+    # transpose row tuples into column lists in C
+    return {c: list(col) for c, col in zip(COLUMNS, zip(*rows))}
+
+
+def load_stats() -> dict[str, list]:
+    files = _stat_files()
+    cols = {c: [] for c in COLUMNS}
+    if not files:
+        return cols
+
+    # Files are independent: parse them across processes (JSON parsing is CPU-bound).
+    workers = max(1, min(len(files), (os.cpu_count() or 2) // 2))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for chunk in ex.map(_parse_file, files, chunksize=4):
+            for c in COLUMNS:
+                cols[c].extend(chunk[c])
+    return cols
+
+
+def main():
+    cols = load_stats()
+    n = len(cols["ts_ms"])
+
+    # sort by time: one C-level argsort over an int64 column instead of a
+    # Python key call per element (stable, so ties keep file order)
+    ts = np.fromiter((t or 0 for t in cols["ts_ms"]), dtype=np.int64, count=n)
+    order = np.argsort(ts, kind="stable")
+
+    print(f"Loaded {n} stats records\n")
+
+    # pretty print recent history: gather the tail columns once, format every
+    # line, then emit a single write
+    tail_idx = order[-TAIL_ROWS:]
+    tail = tail_idx.tolist()
+    tail_cols = [[cols[c][i] for i in tail] for c in COLUMNS]
+    # HH:MM:SS for the whole tail in one vectorized conversion
+    # ("YYYY-MM-DDTHH:MM:SS" -> last 8 chars)
+    tail_ts = ts[tail_idx].astype("datetime64[ms]")
+    tail_cols[0] = [s[-8:] for s in np.datetime_as_string(tail_ts, unit="s").tolist()]
+    lines = []
+    for t, venue, ok, fail, h429, to, p50, p95, cooldown, inflight in zip(*tail_cols):
+        lines.append(
+            f"{t}  {venue:<11}  "
+            f"ok={ok:>3}  "
+            f"fail={fail:>3}  "
+            f"429={h429:>3}  "
+            f"to={to:>3}  "
+            f"p50={p50 or '-':>4}ms  "
+            f"p95={p95 or '-':>4}ms  "
+            f"cooldown={cooldown:>4.0f}s  "
+            f"inflight={inflight:>2}"
+        )
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
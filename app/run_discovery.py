@@ -7,13 +7,13 @@ from config.limitless_rules import LIMITLESS_RULES
 
 from collectors.discovery_service import DiscoveryService
 from collectors.venue_runtime import VenueRuntime
+from collectors.logging_setup import setup_queue_logging
 
-from venues.limitless.client import LimitlessVenueClient
-from venues.polymarket.client import PolymarketClient
+from venues import clients
 
 
-limitless_client = LimitlessVenueClient()
-poly_client = PolymarketClient()
+limitless_client = clients.limitless()
+poly_client = clients.polymarket()
 
 
 def discover_polymarket():
@@ -23,6 +23,8 @@ def discover_limitless():
     return limitless_client.discover_instruments(LIMITLESS_RULES)
 
 def main():
+    setup_queue_logging()
+
     limitless = VenueRuntime(
         name="limitless",
         client=limitless_client,
@@ -4,19 +4,19 @@ from config.settings import settings
 
 from collectors.market_logger import MarketLogger
 from collectors.venue_runtime import VenueRuntime
+from collectors.logging_setup import setup_queue_logging
 
-from venues.limitless.client import LimitlessVenueClient
 from venues.limitless.normalizer import normalize_orderbook
 
-from venues.polymarket.client import PolymarketClient
+from venues import clients
 
 from config.polymarket_rules import POLYMARKET_RULES
 from config.limitless_rules import LIMITLESS_RULES
 
 
 
-limitless_client = LimitlessVenueClient()
-poly_client = PolymarketClient()
+limitless_client = clients.limitless()
+poly_client = clients.polymarket()
 
 
 def discover_polymarket():
@@ -28,7 +28,7 @@ def discover_limitless():
 
 
 def main():
-    print("entered code")
+    setup_queue_logging()
 
     limitless = VenueRuntime(
         name="limitless",
@@ -52,5 +52,4 @@ def main():
 
 
 if __name__ == "__main__":
-    print('hi')
     main()
\ No newline at end of file
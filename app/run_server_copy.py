@@ -1,4 +1,7 @@
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -8,26 +11,64 @@ DEST_ROOT = Path("/Users/maciejdragan/Python VSCode Projects/limitless_mm/limitl
 # ---- CONFIG ----
 # Copy files modified AFTER this date
 CUTOFF_DATE = datetime(2026, 1, 8)
+# Concurrent copies (source is a network mount: per-file latency dominates)
+COPY_WORKERS = 16
 # ----------------
 
 cutoff_ts = CUTOFF_DATE.timestamp()
 
+# copies run on worker threads: one print at a time so lines don't interleave
+_print_lock = threading.Lock()
+
+def _walk(root: str):
+    """
+    Yield os.DirEntry objects for everything under root, depth-first.
+
+    scandir hands back the file type from the directory read itself, and
+    DirEntry.stat() caches its result, so each file costs at most one stat.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path)
+
+
+def _copy_one(pair: tuple[str, Path, Path]) -> None:
+    src, dst_path, rel_path = pair
+    with _print_lock:
+        print(f"Copying: {rel_path}")
+    # copy2 already uses the platform fast-copy path (sendfile / fcopyfile)
+    shutil.copy2(src, dst_path)
+
+
 def copy_filtered_tree(src_root: Path, dst_root: Path, cutoff_ts: float):
-    for src_path in src_root.rglob("*"):
-        rel_path = src_path.relative_to(src_root)
+    src_prefix_len = len(str(src_root).rstrip(os.sep)) + 1
+
+    # Pass 1: walk + mtime filter. Directories are yielded before their
+    # contents, so every destination parent exists before any copy starts.
+    pairs: list[tuple[str, Path, Path]] = []
+    for entry in _walk(str(src_root)):
+        rel_path = Path(entry.path[src_prefix_len:])
         dst_path = dst_root / rel_path
 
-        if src_path.is_dir():
+        # follow_symlinks=False, matching _walk: a symlinked directory is not
+        # descended into, so skip it rather than create it empty here
+        if entry.is_dir(follow_symlinks=False):
             dst_path.mkdir(parents=True, exist_ok=True)
             continue
+        if entry.is_symlink() and entry.is_dir():
+            continue
 
-        stat = src_path.stat()
-        if stat.st_mtime < cutoff_ts:
+        if entry.stat().st_mtime < cutoff_ts:
             continue
 
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        print(f"Copying: {rel_path}")
-        shutil.copy2(src_path, dst_path)
+        pairs.append((entry.path, dst_path, rel_path))
+
+    # Pass 2: overlap the copies
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as ex:
+        # list() so a failed copy raises here instead of being dropped
+        list(ex.map(_copy_one, pairs))
 
 if __name__ == "__main__":
     if not SOURCE_ROOT.exists():
@@ -2,9 +2,6 @@ import time
 
 import pandas as pd 
 
-pd.set_option("display.max_rows", None)
-pd.set_option("display.max_columns", None)
-
 from datetime import datetime, timezone
 from pathlib import Path
 from readers.market_catalog.catalog import MarketCatalog
@@ -31,7 +28,9 @@ dfi = cat.instruments_df()
 q = InstrumentQuery.from_catalog(cat).venues("polymarket").cadence_in("15m").underlying_in("BTC")
 df, ims = q.df_and_items(top_n=150, sort_by='expiration_ms', descending=True)
 
-df
+# full display only here; other reprs keep pandas' default truncation
+with pd.option_context("display.max_rows", None, "display.max_columns", None):
+    print(df)
 #%%
 im = ims[3]
 print('first seen:', _ms_to_utc_str(im.first_seen_ms))
@@ -11,8 +11,7 @@ from config.settings import settings, POLYMARKET_RULES
 from collectors.discovery_service import DiscoveryService
 from collectors.venue_runtime import VenueRuntime
 
-from venues.limitless.client import LimitlessVenueClient
-from venues.polymarket.client import PolymarketClient
+from venues import clients
 
 
 
@@ -23,15 +22,16 @@ def discover_limitless():
     return limitless_client.discover_instruments(settings.UNDERLYINGS)
 
 
-limitless_client = LimitlessVenueClient()
-poly_client = PolymarketClient()
+limitless_client = clients.limitless()
+poly_client = clients.polymarket()
 
 xl = discover_limitless()
 #xp = discover_polymarket()
 
 
-for d in xl: 
-    for k, v in d.items():
-        print(k, ':', v)
-
-    print('\n---------\n')
\ No newline at end of file
+# build the whole dump, print once
+if xl:
+    print("\n".join(
+        "\n".join(f"{k} : {v}" for k, v in d.items()) + "\n\n---------\n"
+        for d in xl
+    ))
\ No newline at end of file
@@ -1,4 +1,4 @@
-import json
+import orjson
 from pathlib import Path
 
 from readers.market_catalog.parsers import LimitlessParser
@@ -17,13 +17,12 @@ jsonl_path = Path(
 YOUR_JSON_LINE_STRING = read_first_line(jsonl_path)
 
 p = LimitlessParser()
-rec = json.loads(YOUR_JSON_LINE_STRING)
+rec = orjson.loads(YOUR_JSON_LINE_STRING)
 drafts = p.parse_line(rec)
 print(drafts[0].instrument_id, drafts[0].cadence, drafts[0].expiration_ms)
 
 
 print('--------------------- Polymarket Test---------------------------------------')
-import json
 from readers.market_catalog.parsers import PolymarketParser
 
 jsonl_path = Path(
@@ -34,6 +33,6 @@ print(POLY_STRING)
 print(' ')
 
 p = PolymarketParser()
-rec = json.loads(POLY_STRING)
+rec = orjson.loads(POLY_STRING)
 d = p.parse_line(rec)[0]
 print(d.instrument_id, d.outcome, d.rule, d.cadence, d.expiration_ms)
\ No newline at end of file
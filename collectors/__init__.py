@@ -1 +1,5 @@
-"""market data collectors live here"""
\ No newline at end of file
+"""market data collectors live here"""
+
+from collectors.logging_setup import install_default_handler
+
+install_default_handler()
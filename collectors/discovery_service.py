@@ -1,49 +1,82 @@
 # collectors/discovery_service.py
 
-import json
+import logging
 import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
 
 from config.settings import settings
 from collectors.venue_runtime import VenueRuntime
 from storage.jsonl_writer import JsonlRotatingWriter
 
 
-def _atomic_write_json(path: Path, payload: Dict[str, Any]) -> None:
+log = logging.getLogger(__name__)
+
+
+# Full venue payloads carried on discovered instruments. They are persisted in
+# the markets JSONL (the catalog parsers read them) but the poller never uses
+# them, so they are kept out of the snapshot it reloads.
+_RAW_PAYLOAD_KEYS = ("raw", "raw_market")
+
+
+# Fallback chains for an instrument's poll key. The instrument_key derivation
+# runs before instrument_id is canonicalized, so it may use the venue's own
+# instrument_id; the envelope step prefers the already-derived instrument_key.
+_IKEY_SOURCE_KEYS = ("poll_key", "slug", "asset_id", "instrument_id")
+_PK_KEYS = ("poll_key", "slug", "asset_id", "instrument_key")
+
+
+def _resolve_pk(inst: Dict[str, Any], keys: tuple = _PK_KEYS) -> Any:
+    """First truthy value among inst[k] for k in keys (None if none), like an `or` chain."""
+    return next(filter(None, map(inst.get, keys)), None)
+
+
+def _snapshot_view(inst: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of an instrument without the raw venue payload."""
+    return {k: val for k, val in inst.items() if k not in _RAW_PAYLOAD_KEYS}
+
+
+def _atomic_write_json(path: Path, payload: Dict[str, Any], durable: bool = False) -> None:
     """
     Atomic-ish JSON write (POSIX): write temp file then rename.
     Ensures poller never reads a partially written snapshot.
+
+    durable=True also fsyncs the temp file before the rename. Snapshots don't
+    need it: they are regenerated from venue discovery (the markets JSONL is
+    the record of truth), and the rename alone gives readers atomicity.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
 
     tmp_path = path.with_suffix(path.suffix + ".tmp")
-    data = json.dumps(payload, ensure_ascii=False)
+    # orjson emits UTF-8 bytes directly (same output as ensure_ascii=False)
+    data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
 
-    with tmp_path.open("w", encoding="utf-8") as f:
+    with tmp_path.open("wb") as f:
         f.write(data)
-        f.flush()
-        os.fsync(f.fileno())
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
 
     tmp_path.replace(path)
 
 
-def _load_snapshot_instruments(path: Path) -> Dict[str, Any]:
+def _load_snapshot_keys(path: Path) -> set:
     """
-    Best-effort load of prior snapshot instruments dict.
-    Returns {} if missing/malformed/unreadable.
+    Best-effort load of the instrument keys in a prior snapshot.
+    Returns an empty set if missing/malformed/unreadable.
     """
     try:
-        if not path.exists():
-            return {}
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = orjson.loads(path.read_bytes())
         inst = payload.get("instruments")
-        return inst if isinstance(inst, dict) else {}
+        return set(inst.keys()) if isinstance(inst, dict) else set()
     except Exception:
-        return {}
+        return set()
 
 
 @dataclass
@@ -57,110 +90,192 @@ class DiscoveryService:
     venues: List[VenueRuntime]
     snapshot_name: str = "active_instruments.snapshot.json"
 
-    def run_once(self) -> None:
-        for v in self.venues:
-            v.out_dir.mkdir(parents=True, exist_ok=True)
-
-            snap_path = v.out_dir / "state" / self.snapshot_name
-
-            # --- run venue discovery ---
-            instruments = v.discover_fn() or []
-
-            # --- build active dict from discovered instruments ---
-            active: dict[str, dict] = {}
-            for inst in instruments:
-                # Prefer explicit instrument_key if the venue provides it
-                ikey = inst.get("instrument_key")
-
-                # Otherwise derive from poll_key (preferred) or instrument_id fallback
-                if not ikey:
-                    pk = inst.get("poll_key") or inst.get("slug") or inst.get("asset_id") or inst.get("instrument_id")
-                    if pk is not None:
-                        ikey = f"{v.name}:{str(pk)}"
-                        inst["instrument_key"] = ikey
-
-                if not ikey:
-                    continue
-
-                # ensure venue is set
-                inst.setdefault("venue", v.name)
+    # venue name -> instrument keys in the last snapshot we wrote (or found on
+    # disk at first sight of the venue). Avoids re-reading the snapshot each cycle.
+    _known_keys: Dict[str, set] = field(default_factory=dict, init=False, repr=False)
 
-                active[str(ikey)] = inst
+    # one worker per venue, created on first run_once
+    _pool: Optional[ThreadPoolExecutor] = field(default=None, init=False, repr=False)
 
-            # --- compare against prior snapshot membership ---
-            old_instruments = _load_snapshot_instruments(snap_path)
-
-            old_keys = set(old_instruments.keys())
-            new_keys = set(active.keys())
-
-            added_keys = new_keys - old_keys
-            removed_keys = old_keys - new_keys
-
-            changed = bool(added_keys or removed_keys)
-
-            if not changed:
-                # No file churn: no snapshot rewrite, no markets jsonl write
-                print(f"<DiscoveryApp>: venue={v.name} no change (count={len(active)})")
-                continue
-
-            # --- only now: open writer (avoid creating a new jsonl unless changed) ---
-            current_date = datetime.utcnow().strftime("%Y-%m-%d")
-            markets_writer = JsonlRotatingWriter(
-                v.out_dir / "markets" / f"date={current_date}",
-                "markets",
-                settings.ROTATE_MINUTES,
-                settings.FSYNC_SECONDS,
-            )
+    # venue name -> (UTC date, markets writer). Opened on the first membership
+    # change of a date and kept until the date rolls over or run_forever exits.
+    _writers: Dict[str, Tuple[str, JsonlRotatingWriter]] = field(default_factory=dict, init=False, repr=False)
 
+    def _markets_writer(self, v: VenueRuntime, current_date: str) -> JsonlRotatingWriter:
+        """Long-lived markets writer for a venue; reopened on UTC date change."""
+        cached = self._writers.get(v.name)
+        if cached is not None:
+            date_str, writer = cached
+            if date_str == current_date:
+                return writer
             try:
-                now_iso = datetime.utcnow().isoformat()
-
-                # Write market/instrument metadata (discovery-owned)
-                for inst in instruments:
-                    # envelope fields for readers
-                    inst.setdefault("record_type", "market")  # (you can rename to "instrument" later if you want)
-                    inst.setdefault("schema_version", settings.SCHEMA_VERSION_MARKETS)
-
-                    venue = inst.get("venue") or v.name
-                    inst.setdefault("venue", venue)
-
-                    pk = inst.get("poll_key") or inst.get("slug") or inst.get("asset_id") or inst.get("instrument_key")
-                    if pk is not None:
-                        inst.setdefault("poll_key", str(pk))
-                        canonical_id = f"{venue}:{str(pk)}"
-                        if inst.get("instrument_id") != canonical_id:
-                            inst["instrument_id"] = canonical_id
+                writer.close()
+            except Exception:
+                pass
+
+        writer = JsonlRotatingWriter(
+            v.out_dir / "markets" / f"date={current_date}",
+            "markets",
+            settings.ROTATE_MINUTES,
+            settings.FSYNC_SECONDS,
+        )
+        self._writers[v.name] = (current_date, writer)
+        return writer
+
+    def close(self) -> None:
+        """Close cached markets writers and the venue pool. Safe to call multiple times."""
+        for _, writer in self._writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+        self._writers.clear()
 
-                    markets_writer.write(inst)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
-                snapshot = {
-                    "asof_ts_utc": now_iso,
-                    "venue": v.name,
-                    "count": len(active),
-                    "instruments": active,
-                }
+    def run_once(self) -> None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max(1, len(self.venues)),
+                thread_name_prefix="discovery",
+            )
 
-                _atomic_write_json(snap_path, snapshot)
+        # Venues are independent (discovery is network-bound): run them side by
+        # side so the cycle takes max(venue) rather than sum(venue). A failing
+        # venue is logged and no longer aborts the others.
+        futures = {
+            self._pool.submit(self._run_one_venue, v): v
+            for v in self.venues
+        }
+        for fut in as_completed(futures):
+            v = futures[fut]
+            exc = fut.exception()
+            if exc is not None:
+                log.warning("<DiscoveryApp|Warning>: venue=%s discovery failed: %s: %s", v.name, type(exc).__name__, exc)
+
+    def _run_one_venue(self, v: VenueRuntime) -> None:
+        """Discover one venue and, if membership changed, write its markets log + snapshot."""
+        v.out_dir.mkdir(parents=True, exist_ok=True)
+
+        snap_path = v.out_dir / "state" / self.snapshot_name
+
+        # --- run venue discovery ---
+        instruments = v.discover_fn() or []
+
+        # --- single pass: derive instrument_key, apply envelope fields, build active ---
+        venue_name = v.name
+        schema_version = settings.SCHEMA_VERSION_MARKETS
+
+        # hoisted: every canonical id for this venue starts with it
+        venue_prefix = venue_name + ":"
+
+        active: dict[str, dict] = {}
+        for inst in instruments:
+            # Prefer explicit instrument_key if the venue provides it
+            ikey = inst.get("instrument_key")
+
+            # Otherwise derive from poll_key (preferred) or instrument_id fallback.
+            # Must run before instrument_id is canonicalized below.
+            if not ikey:
+                pk = _resolve_pk(inst, _IKEY_SOURCE_KEYS)
+                if pk is not None:
+                    ikey = venue_prefix + (pk if type(pk) is str else str(pk))
+                    inst["instrument_key"] = ikey
+
+            # envelope fields for readers
+            if "record_type" not in inst:
+                inst["record_type"] = "market"  # (you can rename to "instrument" later if you want)
+            if "schema_version" not in inst:
+                inst["schema_version"] = schema_version
+
+            venue = inst.get("venue") or venue_name
+            if "venue" not in inst:
+                inst["venue"] = venue
+
+            pk = _resolve_pk(inst)
+            if pk is not None:
+                pk_s = pk if type(pk) is str else str(pk)
+                if "poll_key" not in inst:
+                    inst["poll_key"] = pk_s
+                prefix = venue_prefix if venue == venue_name else f"{venue}:"
+                # compare in place; only build the id string when it differs
+                existing = inst.get("instrument_id")
+                if not (
+                    type(existing) is str
+                    and len(existing) == len(prefix) + len(pk_s)
+                    and existing.startswith(prefix)
+                    and existing.endswith(pk_s)
+                ):
+                    inst["instrument_id"] = prefix + pk_s
+
+            if not ikey:
+                continue
 
-                print(
-                    f"<DiscoveryApp>: venue={v.name} instruments={len(active)} "
-                    f"added={len(added_keys)} removed={len(removed_keys)} snapshot={snap_path}"
-                )
-
-            finally:
-                try:
-                    markets_writer.close()
-                except Exception:
-                    pass
+            active[str(ikey)] = inst
+
+        # --- compare against prior snapshot membership ---
+        # (seeded from disk once per venue, then tracked in memory; membership
+        # rather than a content hash, since fields like minutes_to_expiry
+        # change every cycle)
+        old_keys = self._known_keys.get(v.name)
+        if old_keys is None:
+            old_keys = _load_snapshot_keys(snap_path)
+            self._known_keys[v.name] = old_keys
+        new_keys = set(active.keys())
+
+        added_keys = new_keys - old_keys
+        removed_keys = old_keys - new_keys
+
+        changed = bool(added_keys or removed_keys)
+
+        if not changed:
+            # No file churn: no snapshot rewrite, no markets jsonl write
+            log.info("<DiscoveryApp>: venue=%s no change (count=%d)", v.name, len(active))
+            return
+
+        # one clock read, taken after discovery returned: partition date +
+        # snapshot asof (the discovery time readers see as snapshot_asof)
+        now = datetime.utcnow()
+        current_date = now.strftime("%Y-%m-%d")
+        now_iso = now.isoformat()
+
+        # --- only now: get the writer (avoid creating a new jsonl unless changed) ---
+        markets_writer = self._markets_writer(v, current_date)
+
+        # Write market/instrument metadata (discovery-owned; envelope
+        # fields applied above), one write for the whole venue batch.
+        # Flush so readers see it now: the writer stays open between cycles.
+        markets_writer.write_many(instruments)
+        markets_writer.flush()
+
+        snapshot = {
+            "asof_ts_utc": now_iso,
+            "venue": v.name,
+            "count": len(active),
+            "instruments": {k: _snapshot_view(inst) for k, inst in active.items()},
+        }
+
+        _atomic_write_json(snap_path, snapshot, durable=False)
+        self._known_keys[v.name] = new_keys
+
+        log.info(
+            "<DiscoveryApp>: venue=%s instruments=%d added=%d removed=%d snapshot=%s",
+            v.name, len(active), len(added_keys), len(removed_keys), snap_path,
+        )
 
     def run_forever(self) -> None:
-        while True:
-            start = time.time()
-            try:
-                self.run_once()
-            except Exception as exc:
-                print(f"<DiscoveryApp|Warning>: run_once failed: {type(exc).__name__}: {exc}")
-
-            elapsed = time.time() - start
-            sleep_for = max(1.0, settings.DISCOVER_EVERY_SECONDS - elapsed)
-            time.sleep(sleep_for)
+        try:
+            while True:
+                start = time.time()
+                try:
+                    self.run_once()
+                except Exception as exc:
+                    log.warning("<DiscoveryApp|Warning>: run_once failed: %s: %s", type(exc).__name__, exc)
+
+                elapsed = time.time() - start
+                sleep_for = max(1.0, settings.DISCOVER_EVERY_SECONDS - elapsed)
+                time.sleep(sleep_for)
+        finally:
+            self.close()
@@ -0,0 +1,71 @@
+"""
+collectors/logging_setup.py
+
+Process-wide console logging for the long-running apps (discovery, poller).
+
+Log calls on the polling / discovery threads only enqueue the record; a single
+background QueueListener thread does the formatting and the stdout write. The
+console output is the bare message, so lines look exactly like the old print()
+output (e.g. "<PollApp>: venue=... saved=...").
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+APP_LOGGER = "collectors"
+
+_listener: Optional[QueueListener] = None
+
+# Synchronous fallback for code that never calls setup_queue_logging()
+# (app/test_poly.py, notebooks): INFO lines still reach stdout like the old
+# print() output did. Installed on package import, replaced by the queue.
+_default_handler = logging.StreamHandler(sys.stdout)
+_default_handler.setFormatter(logging.Formatter("%(message)s"))
+
+
+def install_default_handler() -> None:
+    """Attach the plain stdout handler to the app logger, unless one is already set."""
+    app = logging.getLogger(APP_LOGGER)
+    if app.handlers:
+        return
+    app.setLevel(logging.INFO)
+    app.addHandler(_default_handler)
+    app.propagate = False
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route the app's loggers through a queue drained by a background thread.
+
+    Only the "collectors" logger tree is configured; the root logger is left
+    alone so third-party INFO chatter (e.g. httpx's per-request lines) does
+    not reach stdout at poll rate.
+
+    Idempotent: later calls return the already-running listener. The listener
+    is stopped (and the queue flushed) at interpreter exit.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    q: queue.Queue = queue.Queue(-1)  # unbounded: never block the caller
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+
+    app = logging.getLogger(APP_LOGGER)
+    app.removeHandler(_default_handler)
+    app.setLevel(level)
+    app.addHandler(QueueHandler(q))
+    app.propagate = False
+
+    _listener = QueueListener(q, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
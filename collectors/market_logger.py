@@ -27,38 +27,54 @@ Discovery should run in a separate process and write the snapshot files.
 
 from __future__ import annotations
 
-import json
+import logging
 import os
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+
+import orjson
 
 from config.settings import settings
 from collectors.venue_runtime import VenueRuntime
 from storage.jsonl_writer import JsonlRotatingWriter
 
 
+log = logging.getLogger(__name__)
+
+
 # -------------------------
-# Small helpers (printing)
+# Small helpers (logging)
 # -------------------------
-def _print_instrument_list(prefix: str, instruments: dict[str, dict], keys: set[str]) -> None:
-    if not keys:
+def _log_instrument_list(prefix: str, instruments: dict[str, dict], keys: Iterable[str]) -> None:
+    if not keys or not log.isEnabledFor(logging.INFO):
         return
     slugs = [instruments[k].get("slug", "") for k in keys if k in instruments]
     max_slug = max((len(s) for s in slugs), default=0)
 
+    lines = []
     for k in sorted(keys):
         inst = instruments.get(k)
         if not inst:
             continue
         slug = inst.get("slug", "")
         title = inst.get("question") or inst.get("title") or ""
-        print(f"  {prefix} slug={slug:<{max_slug}} | {title}")
+        lines.append(f"  {prefix} slug={slug:<{max_slug}} | {title}")
+
+    # one log record (one write) for the whole block
+    if lines:
+        log.info("\n".join(lines))
+
+
+def _next_utc_midnight(ts: float) -> float:
+    """Epoch seconds of the first UTC midnight strictly after ts."""
+    return (ts // 86400 + 1) * 86400
 
 
 # -------------------------
@@ -71,13 +87,25 @@ class VenueLimits:
     max_inflight: int
 
 
+@dataclass(slots=True)
+class FailState:
+    """Per-instrument failure/backoff state (monotonic time)."""
+    count: int = 0
+    next_ok: float = 0.0
+    last_log: float = 0.0
+
+
 @dataclass
 class WorkItem:
     """A single polling unit of work derived from the active snapshot."""
     ikey: str
     poll_key: str
     info: dict
-    st: dict  # per-instrument failure state (count/next_ok/last_log)
+    st: FailState  # per-instrument failure state
+
+    # snap dict with every per-instrument (and per-snapshot) field filled in;
+    # per tick it is copied and only timestamp/orderbook are set
+    snap_template: dict = field(default_factory=dict)
 
 
 @dataclass
@@ -115,16 +143,29 @@ class VenueState:
     stats_writer: Optional[JsonlRotatingWriter] = None
     errors_writer: Optional[JsonlRotatingWriter] = None
 
+    # epoch seconds of the next UTC midnight (rollover check is a float compare)
+    next_rollover_ts: float = 0.0
+
     # discovery snapshot tracking
     snapshot_path: Path = Path()
-    snapshot_mtime: float = 0.0
+    # (st_mtime_ns, st_size, st_ino) of the last loaded snapshot file
+    snapshot_sig: Optional[tuple[int, int, int]] = None
     snapshot_asof: Optional[str] = None
 
     # active instruments (poller in-memory view)
     active: dict[str, dict] = field(default_factory=dict)
 
+    # absolute deadline of this venue's next poll tick (monotonic time)
+    next_poll_mono: float = 0.0
+
     # failure/backoff + cooldown (monotonic time)
-    fail_state: dict[str, dict] = field(default_factory=dict)
+    fail_state: dict[str, FailState] = field(default_factory=dict)
+
+    # poll work list derived from active (rebuilt only on snapshot reload)
+    work: list[WorkItem] = field(default_factory=list)
+
+    # latest next_ok handed out by backoff; past it, no instrument is gated
+    backoff_horizon: float = 0.0
     cooldown_until: float = 0.0
 
     # concurrency
@@ -249,6 +290,7 @@ class MarketLogger:
             "orderbooks",
             settings.ROTATE_MINUTES,
             settings.FSYNC_SECONDS,
+            buffer_bytes=settings.WRITE_BUFFER_BYTES,
         )
         stats_writer = JsonlRotatingWriter(
             v.out_dir / "poll_stats" / f"date={date_str}",
@@ -269,7 +311,8 @@ class MarketLogger:
         venue_state: dict[str, VenueState] = {}
 
         for v in self.venues:
-            date_str = datetime.utcnow().strftime("%Y-%m-%d")
+            now = time.time()
+            date_str = time.strftime("%Y-%m-%d", time.gmtime(now))
             books_writer, stats_writer, errors_writer = self._open_writers(v, date_str)
 
             snap_path = v.out_dir / "state" / "active_instruments.snapshot.json"
@@ -280,6 +323,7 @@ class MarketLogger:
             vs = VenueState(
                 venue=v,
                 current_date=date_str,
+                next_rollover_ts=_next_utc_midnight(now),
                 books_writer=books_writer,
                 stats_writer=stats_writer,
                 errors_writer=errors_writer,
@@ -292,11 +336,11 @@ class MarketLogger:
             venue_state[v.name] = vs
 
             if vs.aimd is None:
-                print(f"<PollApp>: venue={v.name} concurrency workers={limits.max_workers} inflight={limits.max_inflight}")
+                log.info("<PollApp>: venue=%s concurrency workers=%s inflight=%s", v.name, limits.max_workers, limits.max_inflight)
             else:
-                print(
-                    f"<PollApp>: venue={v.name} concurrency workers={limits.max_workers} "
-                    f"inflight={limits.max_inflight} aimd_inflight={vs.aimd.inflight} aimd_ceiling={vs.aimd.ceiling}"
+                log.info(
+                    "<PollApp>: venue=%s concurrency workers=%s inflight=%s aimd_inflight=%s aimd_ceiling=%s",
+                    v.name, limits.max_workers, limits.max_inflight, vs.aimd.inflight, vs.aimd.ceiling,
                 )
 
         return venue_state
@@ -322,8 +366,14 @@ class MarketLogger:
     def _rollover_if_needed(self, vs: VenueState) -> None:
         """Midnight UTC rollover: close all writers and open new date writers."""
         v = vs.venue
+        now = time.time()
+        if now < vs.next_rollover_ts:
+            return
+
+        # only format a date string once we've actually crossed midnight
+        vs.next_rollover_ts = _next_utc_midnight(now)
         old_date = vs.current_date
-        new_date = datetime.utcnow().strftime("%Y-%m-%d")
+        new_date = time.strftime("%Y-%m-%d", time.gmtime(now))
         if new_date == old_date:
             return
 
@@ -337,7 +387,7 @@ class MarketLogger:
             vs.books_writer = books_writer
             vs.stats_writer = stats_writer
             vs.errors_writer = errors_writer
-            print(f"<PollApp>: rollover venue={v.name} {old_date} -> {new_date}")
+            log.info("<PollApp>: rollover venue=%s %s -> %s", v.name, old_date, new_date)
 
     # -------------------------
     # Snapshot reload (sticky semantics)
@@ -347,22 +397,26 @@ class MarketLogger:
         snap_path = vs.snapshot_path
 
         try:
-            if not snap_path.exists():
+            # one stat answers both "exists?" and "changed?"
+            try:
+                st = os.stat(snap_path)
+            except FileNotFoundError:
                 return
 
-            st = os.stat(snap_path)
-            mtime = st.st_mtime
-            if mtime <= vs.snapshot_mtime:
+            # discovery publishes by rename, so a new snapshot is a new inode;
+            # mtime_ns + size catch in-place rewrites at sub-second resolution
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            if sig == vs.snapshot_sig:
                 return
 
-            payload = json.loads(snap_path.read_text(encoding="utf-8"))
+            payload = orjson.loads(snap_path.read_bytes())
             instruments = payload.get("instruments")
             if not isinstance(instruments, dict):
-                print(f"<PollApp|Warning>: snapshot malformed venue={vs.venue.name}: no instruments dict")
+                log.warning("<PollApp|Warning>: snapshot malformed venue=%s: no instruments dict", vs.venue.name)
                 return
 
-            old_active = dict(vs.active)
-            old_keys = set(old_active.keys())
+            # the previous active dict is replaced, not mutated: no defensive copy
+            old_active = vs.active
 
             now_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
 
@@ -387,45 +441,43 @@ class MarketLogger:
                 if _not_expired(inst):
                     merged[ikey] = inst
 
-            for ikey in list(merged.keys()):
-                inst = merged.get(ikey) or {}
-                exp = _parse_exp_ms(inst)
-                if exp is not None and exp <= now_ms:
-                    del merged[ikey]
-
-            new_keys = set(merged.keys())
+            expired = [
+                ikey
+                for ikey, inst in merged.items()
+                if (exp := _parse_exp_ms(inst or {})) is not None and exp <= now_ms
+            ]
+            for ikey in expired:
+                del merged[ikey]
 
-            vs.active.clear()
-            vs.active.update(merged)
+            vs.active = merged
 
-            for k in list(vs.fail_state.keys()):
-                if k not in vs.active:
-                    del vs.fail_state[k]
+            # membership diff straight off the two dicts (no temporary key sets)
+            added_keys = [k for k in merged if k not in old_active]
+            removed_keys = [k for k in old_active if k not in merged]
 
-            vs.snapshot_mtime = mtime
+            # asof first: it is baked into the work items' snap templates
+            vs.snapshot_sig = sig
             vs.snapshot_asof = payload.get("asof_ts_utc")
 
-            added_keys = new_keys - old_keys
-            removed_keys = old_keys - new_keys
+            self._rebuild_work(vs)
 
-            print(
-                f"<PollApp>: loaded snapshot venue={vs.venue.name} "
-                f"count={len(vs.active)} added={len(added_keys)} removed={len(removed_keys)} "
-                f"asof={vs.snapshot_asof}"
+            log.info(
+                "<PollApp>: loaded snapshot venue=%s count=%d added=%d removed=%d asof=%s",
+                vs.venue.name, len(vs.active), len(added_keys), len(removed_keys), vs.snapshot_asof,
             )
 
             if added_keys:
-                print(f"<PollApp>: added instruments venue={vs.venue.name}")
-                _print_instrument_list("+", merged, added_keys)
+                log.info("<PollApp>: added instruments venue=%s", vs.venue.name)
+                _log_instrument_list("+", merged, added_keys)
 
             if removed_keys:
-                print(f"<PollApp>: removed instruments venue={vs.venue.name}")
-                _print_instrument_list("-", old_active, removed_keys)
+                log.info("<PollApp>: removed instruments venue=%s", vs.venue.name)
+                _log_instrument_list("-", old_active, removed_keys)
 
         except Exception as exc:
-            print(
-                f"<PollApp|Warning>: failed to reload snapshot venue={vs.venue.name}: "
-                f"{type(exc).__name__}: {exc}"
+            log.warning(
+                "<PollApp|Warning>: failed to reload snapshot venue=%s: %s: %s",
+                vs.venue.name, type(exc).__name__, exc,
             )
 
     # -------------------------
@@ -436,9 +488,10 @@ class MarketLogger:
         if failures >= max(3, len(vs.active) // 2):
             cooldown = 10
             vs.cooldown_until = now_mono + cooldown
-            print(
-                f"[WARN] high failure rate this loop for venue={vs.venue.name} "
-                f"(failures={failures}, successes={successes}). Cooling down {cooldown}s."
+            log.warning(
+                "[WARN] high failure rate this loop for venue=%s "
+                "(failures=%d, successes=%d). Cooling down %ss.",
+                vs.venue.name, failures, successes, cooldown,
             )
 
     def _cooldown_on_429(self, vs: VenueState, now_mono: float) -> None:
@@ -506,7 +559,7 @@ class MarketLogger:
             vs.aimd.inflight = min(vs.aimd.inflight, vs.aimd.ceiling, vs.limits.max_workers, vs.limits.max_inflight)
             vs.aimd.stable_since_mono = now_mono
             vs.aimd.last_adjust_mono = now_mono
-            print(f"<AIMD>: venue={vs.venue.name} 429_seen old_inflight={old} new_inflight={vs.aimd.inflight}")
+            log.info("<AIMD>: venue=%s 429_seen old_inflight=%s new_inflight=%s", vs.venue.name, old, vs.aimd.inflight)
             return
 
         # Gentle decrease on stress (high fail or high latency)
@@ -518,7 +571,10 @@ class MarketLogger:
             vs.aimd.stable_since_mono = now_mono
             vs.aimd.last_adjust_mono = now_mono
             reason = "fail_rate" if fail_rate >= params["fail_hi"] else "p95_latency"
-            print(f"<AIMD>: venue={vs.venue.name} decrease reason={reason} old_inflight={old} new_inflight={vs.aimd.inflight} fail_rate={fail_rate:.2f} p95={p95}")
+            log.info(
+                "<AIMD>: venue=%s decrease reason=%s old_inflight=%s new_inflight=%s fail_rate=%.2f p95=%s",
+                vs.venue.name, reason, old, vs.aimd.inflight, fail_rate, p95,
+            )
             return
 
         # Additive increase only after long stable window + minimum adjust interval
@@ -534,27 +590,67 @@ class MarketLogger:
             vs.aimd.inflight = min(vs.aimd.ceiling, vs.aimd.inflight + 1, vs.limits.max_workers, vs.limits.max_inflight)
             vs.aimd.last_adjust_mono = now_mono
             if vs.aimd.inflight != old:
-                print(f"<AIMD>: venue={vs.venue.name} increase old_inflight={old} new_inflight={vs.aimd.inflight} stable_for={stable_for:.0f}s p95={p95} fail_rate={fail_rate:.2f}")
+                log.info(
+                    "<AIMD>: venue=%s increase old_inflight=%s new_inflight=%s stable_for=%.0fs p95=%s fail_rate=%.2f",
+                    vs.venue.name, old, vs.aimd.inflight, stable_for, p95, fail_rate,
+                )
 
     # -------------------------
     # Polling helpers
     # -------------------------
-    def _select_eligible(self, vs: VenueState, now_mono: float) -> list[WorkItem]:
-        """Select instruments eligible to poll (honors per-instrument next_ok backoff)."""
-        eligible: list[WorkItem] = []
+    def _rebuild_work(self, vs: VenueState) -> None:
+        """
+        Precompute one WorkItem per pollable active instrument.
+
+        Runs on snapshot reload only, so the per-loop path never re-derives
+        poll keys or touches fail_state. fail_state is rebuilt alongside, in
+        work-list order, holding exactly the work items' states (states of
+        instruments that left the active set are dropped here).
+        """
+        old_fail_state = vs.fail_state
+        fail_state: dict[str, FailState] = {}
+        venue_name = vs.venue.name
+        snapshot_asof = vs.snapshot_asof
+        work: list[WorkItem] = []
 
         for ikey, info in vs.active.items():
-            st = vs.fail_state.get(ikey, {"count": 0, "next_ok": 0.0, "last_log": 0.0})
-            if now_mono < st["next_ok"]:
-                continue
-
             poll_key = info.get("poll_key")
             if poll_key is None:
                 continue
 
-            eligible.append(WorkItem(ikey=ikey, poll_key=str(poll_key), info=info, st=st))
+            # one long-lived state per instrument, carried across reloads
+            st = old_fail_state.get(ikey)
+            if st is None:
+                st = FailState()
+            fail_state[ikey] = st
+
+            poll_key = str(poll_key)
+            snap_template = {
+                "timestamp": None,
+                "snapshot_asof": snapshot_asof,
+
+                "market_id": info.get("market_id"),
+                "slug": info.get("slug"),
+                "underlying": info.get("underlying"),
+                "orderbook": None,
+
+                "instrument_key": ikey,
+                "instrument_id": info.get("instrument_id"),
+                "venue": venue_name,
+                "poll_key": poll_key,
+            }
+
+            work.append(WorkItem(ikey=ikey, poll_key=poll_key, info=info, st=st, snap_template=snap_template))
 
-        return eligible[: self._current_inflight_limit(vs)]
+        vs.work = work
+        vs.fail_state = fail_state
+
+    def _select_eligible(self, vs: VenueState, now_mono: float) -> list[WorkItem]:
+        """Select every instrument eligible to poll (honors per-instrument next_ok backoff)."""
+        if now_mono >= vs.backoff_horizon:
+            # common case: nothing is backing off, the whole (immutable) work list is due
+            return vs.work
+        return [w for w in vs.work if now_mono >= w.st.next_ok]
 
     def _worker_fetch(self, client: Any, poll_key: str) -> tuple[bool, Any, int, Optional[int]]:
         """Worker: returns (ok, payload_or_exc, latency_ms, status_code)."""
@@ -568,21 +664,24 @@ class MarketLogger:
             sc = _extract_status_code(exc)
             return (False, exc, ms, sc)
 
-    def _submit_fetches(self, vs: VenueState, eligible: list[WorkItem], counters: PollCounters) -> dict[Future, WorkItem]:
-        """Submit network fetch jobs to the per-venue executor."""
-        if vs.executor is None:
-            return {}
-
-        futures: dict[Future, WorkItem] = {}
+    def _submit_fetches(
+        self,
+        vs: VenueState,
+        pending: Iterator[WorkItem],
+        futures: dict[Future, WorkItem],
+        limit: int,
+        counters: PollCounters,
+    ) -> None:
+        """Top up the per-venue executor from pending until `limit` fetches are in flight."""
         client = vs.venue.client
-
-        for w in eligible:
+        while len(futures) < limit:
+            w = next(pending, None)
+            if w is None:
+                return
             counters.submitted += 1
             fut = vs.executor.submit(self._worker_fetch, client, w.poll_key)
             futures[fut] = w
 
-        return futures
-
     def _classify_failure(self, exc: Exception, status_code: Optional[int], counters: PollCounters) -> None:
         """Increment appropriate counters for a failure."""
         if status_code == 429:
@@ -596,10 +695,10 @@ class MarketLogger:
         else:
             counters.other_errs += 1
 
-    def _apply_backoff(self, st: dict, now_mono: float) -> int:
+    def _apply_backoff(self, st: FailState, now_mono: float) -> int:
         """Apply exponential backoff with a 60s cap. Returns backoff seconds."""
-        backoff = min(60, 2 ** min(int(st["count"]), 6))
-        st["next_ok"] = now_mono + backoff
+        backoff = min(60, 2 ** min(st.count, 6))
+        st.next_ok = now_mono + backoff
         return int(backoff)
 
     def _maybe_log_failure(
@@ -617,21 +716,25 @@ class MarketLogger:
         slug = w.info.get("slug")
         mid = w.info.get("market_id")
 
-        last_log = float(w.st.get("last_log", 0.0))
-        if w.st["count"] in (1, 3, 5) or (now_mono - last_log > 60):
-            print(
-                f"[WARN] get_orderbook failed "
-                f"venue={vname} ikey={w.ikey} mid={mid} slug={slug} "
-                f"count={w.st['count']} backoff={backoff}s status={status_code} latency_ms={lat_ms} "
-                f"err={type(exc).__name__}: {exc}"
+        st = w.st
+        if st.count in (1, 3, 5) or (now_mono - st.last_log > 60):
+            log.warning(
+                "[WARN] get_orderbook failed "
+                "venue=%s ikey=%s mid=%s slug=%s "
+                "count=%s backoff=%ss status=%s latency_ms=%s "
+                "err=%s: %s",
+                vname, w.ikey, mid, slug,
+                st.count, backoff, status_code, lat_ms,
+                type(exc).__name__, exc,
             )
-            w.st["last_log"] = now_mono
+            st.last_log = now_mono
 
         sample_every = int(getattr(settings, "POLL_ERROR_SAMPLE_EVERY", 0) or 0)
-        if vs.errors_writer is not None and sample_every > 0 and (w.st["count"] % sample_every == 0):
+        if vs.errors_writer is not None and sample_every > 0 and (st.count % sample_every == 0):
+            now = datetime.now(tz=timezone.utc)
             vs.errors_writer.write({
-                "ts_utc": datetime.utcnow().isoformat(),
-                "ts_ms": int(datetime.now(tz=timezone.utc).timestamp() * 1000),
+                "ts_utc": now.replace(tzinfo=None).isoformat(),
+                "ts_ms": int(now.timestamp() * 1000),
                 "venue": vname,
                 "market_id": mid,
                 "slug": slug,
@@ -646,29 +749,23 @@ class MarketLogger:
     def _build_record(self, vs: VenueState, w: WorkItem, raw_ob: dict) -> dict:
         """Build record and enforce join-safe invariants at the write boundary."""
         v = vs.venue
-        slug = w.info.get("slug")
-        mid = w.info.get("market_id")
 
-        snap = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "snapshot_asof": vs.snapshot_asof,
+        # one clock read per record: the ISO string and ts_ms come from the same
+        # instant, so ts_ms below needs no re-parse of the string
+        now = datetime.now(tz=timezone.utc)
+        ts_iso = now.replace(tzinfo=None).isoformat()
+        ts_ms = int(now.timestamp() * 1000)
 
-            "market_id": mid,
-            "slug": slug,
-            "underlying": w.info.get("underlying"),
-            "orderbook": raw_ob,
-
-            "instrument_key": w.ikey,
-            "instrument_id": w.info.get("instrument_id"),
-            "venue": v.name,
-            "poll_key": w.poll_key,
-        }
+        # static fields come prebuilt with the work item (key order preserved)
+        snap = w.snap_template.copy()
+        snap["timestamp"] = ts_iso
+        snap["orderbook"] = raw_ob
 
         rec = v.normalizer(snap, full_orderbook=settings.FULL_ORDERBOOK) or snap
 
         rec.setdefault("venue", v.name)
 
-        pk = rec.get("poll_key") or w.poll_key or slug
+        pk = rec.get("poll_key") or w.poll_key or snap["slug"]
         if pk is not None:
             rec.setdefault("poll_key", pk)
             canonical_id = f"{v.name}:{pk}"
@@ -676,8 +773,10 @@ class MarketLogger:
                 rec["instrument_id"] = canonical_id
 
         if "ts_ms" not in rec:
-            iso = rec.get("ts_utc") or rec.get("timestamp") or snap.get("timestamp")
-            if iso:
+            iso = rec.get("ts_utc") or rec.get("timestamp") or ts_iso
+            if iso == ts_iso:
+                rec["ts_ms"] = ts_ms
+            elif iso:
                 try:
                     s = iso.replace("Z", "+00:00")
                     dt = datetime.fromisoformat(s)
@@ -719,9 +818,10 @@ class MarketLogger:
         p50 = _pct_from_sorted(lat_list, 0.50)
         p95 = _pct_from_sorted(lat_list, 0.95)
 
+        now = datetime.now(tz=timezone.utc)
         vs.stats_writer.write({
-            "ts_utc": datetime.utcnow().isoformat(),
-            "ts_ms": int(datetime.now(tz=timezone.utc).timestamp() * 1000),
+            "ts_utc": now.replace(tzinfo=None).isoformat(),
+            "ts_ms": int(now.timestamp() * 1000),
             "venue": vs.venue.name,
             "active_count": len(vs.active),
 
@@ -754,77 +854,172 @@ class MarketLogger:
     # The poller loop (refactored, same semantics)
     # -------------------------
     def _poll_once(self, vs: VenueState, now_mono: float) -> tuple[int, int]:
-        """Poll all active instruments once for one venue, in parallel (network only)."""
-        if now_mono < vs.cooldown_until:
+        """
+        Poll all eligible instruments once for one venue, in parallel (network only).
+
+        Sliding window: at most the inflight limit is outstanding, and each
+        completion immediately submits the next instrument, so every eligible
+        instrument is polled each loop (not just the first `inflight` of them).
+        A 429 stops further submissions for the rest of the loop.
+        """
+        if now_mono < vs.cooldown_until or vs.executor is None:
             return (0, 0)
 
         counters = PollCounters()
 
-        eligible = self._select_eligible(vs, now_mono=now_mono)
-        futures = self._submit_fetches(vs, eligible, counters=counters)
-
-        for fut in as_completed(futures):
-            w = futures[fut]
-            ok, payload, lat_ms, status_code = fut.result()
-            vs.lat_ms_buf.append(lat_ms)
-
-            if ok:
-                raw_ob = payload
+        limit = self._current_inflight_limit(vs)
+        pending = iter(self._select_eligible(vs, now_mono=now_mono))
+        futures: dict[Future, WorkItem] = {}
+        self._submit_fetches(vs, pending, futures, limit, counters=counters)
 
-                vs.fail_state[w.ikey] = {"count": 0, "next_ok": 0.0, "last_log": 0.0}
-                counters.successes += 1
+        # records completed by the current wait(), written as one batch
+        books: list[dict] = []
+        books_writer = vs.books_writer
 
-                rec = self._build_record(vs, w, raw_ob)
-                vs.books_writer.write(rec)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in done:
+                w = futures.pop(fut)
+                self._handle_result(vs, w, fut.result(), counters, now_mono, books)
 
-            else:
-                exc: Exception = payload
-                counters.failures += 1
+            # Write each completion batch as it lands (one write and at most
+            # one fdatasync check per batch, not per record): a long loop
+            # neither holds records in memory nor defers the fsync timer.
+            if books:
+                books_writer.write_many(books)
+                books.clear()
 
-                w.st["count"] = int(w.st.get("count", 0)) + 1
-                self._classify_failure(exc, status_code, counters)
+            if now_mono < vs.cooldown_until:
+                continue  # drain what is in flight, submit nothing new
+            self._submit_fetches(vs, pending, futures, limit, counters=counters)
 
-                if status_code == 429:
-                    self._cooldown_on_429(vs, now_mono)
-
-                backoff = self._apply_backoff(w.st, now_mono)
-                self._maybe_log_failure(vs, w, exc, status_code, lat_ms, backoff, now_mono)
-                vs.fail_state[w.ikey] = w.st
+        # hand the loop's tail to the OS so readers see it without waiting
+        # for the next fsync to drain the (large) write buffer
+        books_writer.flush()
 
         p95 = self._write_stats_if_due(vs, counters, now_mono=now_mono)
         self._maybe_adjust_aimd(vs, counters, now_mono=now_mono)
 
         return (counters.successes, counters.failures)
 
+    def _handle_result(
+        self,
+        vs: VenueState,
+        w: WorkItem,
+        result: tuple[bool, Any, int, Optional[int]],
+        counters: PollCounters,
+        now_mono: float,
+        books: list[dict],
+    ) -> None:
+        """Process one completed fetch: queue the book record, or count + back off the failure."""
+        ok, payload, lat_ms, status_code = result
+        vs.lat_ms_buf.append(lat_ms)
+
+        if ok:
+            raw_ob = payload
+
+            st = w.st
+            if st.count:
+                # reset in place (healthy instruments skip this entirely)
+                st.count = 0
+                st.next_ok = 0.0
+                st.last_log = 0.0
+            counters.successes += 1
+
+            books.append(self._build_record(vs, w, raw_ob))
+
+        else:
+            exc: Exception = payload
+            counters.failures += 1
+
+            w.st.count += 1
+            self._classify_failure(exc, status_code, counters)
+
+            if status_code == 429:
+                self._cooldown_on_429(vs, now_mono)
+
+            backoff = self._apply_backoff(w.st, now_mono)
+            if w.st.next_ok > vs.backoff_horizon:
+                vs.backoff_horizon = w.st.next_ok
+            self._maybe_log_failure(vs, w, exc, status_code, lat_ms, backoff, now_mono)
+
     # -------------------------
     # Main loop (orchestrator)
     # -------------------------
+    def _tick_venue(self, vs: VenueState, now_mono: float, interval: float) -> None:
+        """One poll tick for one venue: rollover, snapshot reload, poll, cooldown, reschedule."""
+        self._rollover_if_needed(vs)
+        self._maybe_reload_snapshot(vs)
+
+        successes, failures = self._poll_once(vs, now_mono=now_mono)
+        log.info(
+            "<PollApp>: venue=%s saved=%d failed=%d total=%d inflight=%s",
+            vs.venue.name, successes, failures, successes + failures,
+            self._current_inflight_limit(vs),
+        )
+
+        self._maybe_apply_cooldown(vs, successes=successes, failures=failures, now_mono=now_mono)
+
+        # Advance from the previous deadline (not from "now") so the
+        # loop's own duration doesn't accumulate as drift; if we fell
+        # behind, skip the missed ticks rather than burst to catch up.
+        next_poll = vs.next_poll_mono + interval
+        if next_poll < now_mono:
+            next_poll = now_mono + interval
+        # a cooling-down venue has nothing to do until it ends
+        vs.next_poll_mono = max(next_poll, vs.cooldown_until)
+
+    def _venue_loop(self, vs: VenueState, interval: float, stop: threading.Event) -> None:
+        """One venue's own poll loop: tick on its absolute deadline, sleep until the next."""
+        while not stop.is_set():
+            now_mono = time.monotonic()
+            if now_mono >= vs.next_poll_mono:
+                self._tick_venue(vs, now_mono, interval)
+
+            delay = vs.next_poll_mono - time.monotonic()
+            if delay > 0:
+                stop.wait(delay)  # wakes immediately on shutdown
+
     def run(self) -> None:
         venue_state = self._init_venue_state()
+        ordered = [venue_state[vname] for vname in sorted(venue_state.keys())]
+        interval = settings.POLL_INTERVAL
 
-        try:
-            while True:
-                now_mono = time.monotonic()
+        # One loop thread per venue, each on its own cadence: a slow venue (or
+        # one in cooldown) never delays another venue's ticks. Each venue's
+        # writers, executor and state are only touched by its own thread.
+        stop = threading.Event()
+        errors: list[BaseException] = []
 
-                for vname in sorted(venue_state.keys()):
-                    vs = venue_state[vname]
+        def _guarded(vs: VenueState) -> None:
+            try:
+                self._venue_loop(vs, interval, stop)
+            except BaseException as exc:
+                errors.append(exc)
+                stop.set()
 
-                    self._rollover_if_needed(vs)
-                    self._maybe_reload_snapshot(vs)
+        threads = [
+            threading.Thread(target=_guarded, args=(vs,), name=f"poll-{vs.venue.name}", daemon=True)
+            for vs in ordered
+        ]
 
-                    successes, failures = self._poll_once(vs, now_mono=now_mono)
-                    print(
-                        f"<PollApp>: venue={vs.venue.name} "
-                        f"saved={successes} failed={failures} total={successes + failures} "
-                        f"inflight={self._current_inflight_limit(vs)}"
-                    )
+        try:
+            for t in threads:
+                t.start()
 
-                    self._maybe_apply_cooldown(vs, successes=successes, failures=failures, now_mono=now_mono)
+            # main thread only supervises (and receives KeyboardInterrupt)
+            while not stop.wait(1.0):
+                pass
 
-                time.sleep(settings.POLL_INTERVAL)
+            if errors:
+                raise errors[0]  # a venue failure still ends run(), as before
 
         except KeyboardInterrupt:
-            print("<PollApp>: shutdown requested (KeyboardInterrupt)")
+            log.info("<PollApp>: shutdown requested (KeyboardInterrupt)")
         finally:
+            # let in-flight ticks finish before their writers are closed
+            stop.set()
+            for t in threads:
+                t.join()
             for vs in venue_state.values():
                 self._close_venue_state(vs)
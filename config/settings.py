@@ -20,8 +20,9 @@ class AppSettings:
     """
 
     # JSonl Writing Settings ------------------------------------------------------
-    ROTATE_MINUTES: int = 10            # How often to rotate into a new file
+    ROTATE_MINUTES: int = 10            # How often to rotate into a new file (0 = one file per UTC day)
     FSYNC_SECONDS: int = 5              # Force sync file every N seconds (?check?)
+    WRITE_BUFFER_BYTES: int = 1 << 20   # Userspace buffer per orderbook file (records coalesce into one write per fill)
 
 
     # Discovery Settings ----------------------------------------------------------
@@ -21,6 +21,7 @@ Design principles:
 from __future__ import annotations
 
 import json
+import orjson
 import pandas as pd
 from collections import defaultdict
 from dataclasses import dataclass
@@ -167,6 +168,10 @@ class MarketCatalog:
         self._instruments: Dict[str, InstrumentMeta] = {}
         self._markets: Dict[Tuple[str, str], MarketMeta] = {}
 
+        # Bumped by every refresh(); DataFrame views are cached per revision.
+        self._revision = 0
+        self._df_cache: Dict[Tuple[Any, ...], Any] = {}
+
 
     @classmethod
     def default(cls, input_dir: Path | None = None) -> "MarketCatalog":
@@ -326,6 +331,8 @@ class MarketCatalog:
 
         self._instruments = instruments_meta
         self._markets = markets_meta
+        self._revision += 1
+        self._df_cache.clear()
 
     # ------------------------------------------------------------------
     # Convenience helpers
@@ -574,6 +581,15 @@ class MarketCatalog:
     # Notebook helpers (optional pandas)
     # ------------------------------------------------------------------
     def markets_df(self, *, max_rows: int | None = None, max_str: int = 80):
+        """
+        Return a compact pandas DataFrame of indexed markets (readable columns).
+
+        Built once per refresh() (per max_rows/max_str); callers get a copy.
+        """
+        key = ("markets", self._revision, max_rows, max_str)
+        cached = self._df_cache.get(key)
+        if cached is not None:
+            return cached.copy()
 
         rows = []
         for (venue, market_id), m in self._markets.items():
@@ -596,12 +612,21 @@ class MarketCatalog:
         if max_rows is not None:
             df = df.head(int(max_rows))
 
-        return df.reset_index(drop=True)
+        df = df.reset_index(drop=True)
+        self._df_cache[key] = df
+        return df.copy()
 
     def instruments_df(self, *, max_rows: Optional[int] = None, max_str: int = 80):
         """
         Return a compact pandas DataFrame of indexed instruments (readable columns).
+
+        Built once per refresh() (per max_rows/max_str); callers get a copy.
         """
+        key = ("instruments", self._revision, max_rows, max_str)
+        cached = self._df_cache.get(key)
+        if cached is not None:
+            return cached.copy()
+
         rows = []
         for iid, i in self._instruments.items():
             rows.append({
@@ -629,7 +654,9 @@ class MarketCatalog:
         if max_rows is not None:
             df = df.head(int(max_rows))
 
-        return df.reset_index(drop=True)
+        df = df.reset_index(drop=True)
+        self._df_cache[key] = df
+        return df.copy()
 
 
 # ---------------------------------------------------------------------------
@@ -637,13 +664,13 @@ class MarketCatalog:
 # ---------------------------------------------------------------------------
 
 def _iter_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    """Yield parsed JSON objects from a .jsonl file."""
-    with path.open("r", encoding="utf-8") as f:
+    """Yield parsed JSON objects from a .jsonl file (streamed, orjson on bytes)."""
+    with path.open("rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield orjson.loads(line)
 
 def ms_to_utc(ms):
     if not ms:
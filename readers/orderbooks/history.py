@@ -278,11 +278,11 @@ class OrderbookHistory:
         import pandas as pd
         df = pd.DataFrame(self.snapshots)
         # Provide a consistent 't_ms' column = effective timestamp used
+        # (computed from the snapshot dicts directly: df.apply(axis=1) would
+        # build a Series per row just to read two fields)
         if not df.empty:
-            df["t_ms"] = df.apply(
-                lambda r: effective_ts_ms(r, time_field=self.time_field, fallback_field=self.fallback_time_field),
-                axis=1,
-            )
+            tf, ff = self.time_field, self.fallback_time_field
+            df["t_ms"] = [effective_ts_ms(s, time_field=tf, fallback_field=ff) for s in self.snapshots]
         return df
 
     def _normalize_book(self, snap: Mapping[str, Any]) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
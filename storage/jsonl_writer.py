@@ -1,9 +1,15 @@
 import re
-import json
 import os
 import time
 from pathlib import Path
 
+import orjson
+
+
+# fdatasync flushes the data (and the file size) but skips non-essential inode
+# metadata such as mtime. macOS has no os.fdatasync, so fall back to fsync there.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
 
 class JsonlRotatingWriter:
     """
@@ -23,13 +29,24 @@ class JsonlRotatingWriter:
 
     Design notes:
         - Rotation is time-based, not size-based, to simplify downstream readers.
+        rotate_minutes=0 disables it; callers that partition by date directory
+        then get a single file per day.
         - On startup, the writer resumes at the next available part number to avoid
         appending to previously closed files after a restart.
-        - fsync is decoupled from per-write flushes to reduce I/O overhead while still
+        - fsync (fdatasync where available) is decoupled from per-write flushes to reduce I/O overhead while still
         providing bounded data-loss windows on crash.
+        - Records accumulate in a large userspace buffer (buffer_bytes, 64 KiB by
+        default vs. io's 8 KiB), so many small lines go out in one write() syscall.
     """
 
-    def __init__(self, directory: Path, prefix: str, rotate_minutes: int, fsync_seconds: int):
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str,
+        rotate_minutes: int,
+        fsync_seconds: int,
+        buffer_bytes: int = 64 * 1024,
+    ):
         # Directory where JSONL files will be written
         self.dir = directory
         self.dir.mkdir(parents=True, exist_ok=True)
@@ -37,12 +54,16 @@ class JsonlRotatingWriter:
         # Prefix used in file naming: <prefix>.part-XXXX.jsonl
         self.prefix = prefix
 
-        # Rotation interval in seconds
+        # Rotation interval in seconds (0 = never rotate: one part per writer,
+        # i.e. one file per date partition for the poller/discovery writers)
         self.rotate_seconds = rotate_minutes * 60
 
         # Minimum interval between fsync calls
         self.fsync_seconds = fsync_seconds
 
+        # Userspace write buffer size for each part file
+        self.buffer_bytes = buffer_bytes
+
         # Monotonically increasing file part counter
         self.part = 0
 
@@ -85,13 +106,14 @@ class JsonlRotatingWriter:
         """
         if self.fh:
             self.fh.flush()
-            os.fsync(self.fh.fileno())
+            _fdatasync(self.fh.fileno())
             self.fh.close()
 
         path = self.dir / f"{self.prefix}.part-{self.part:04d}.jsonl"
         self.part += 1
 
-        self.fh = open(path, "a", encoding="utf-8")
+        # binary append: records are serialized straight to UTF-8 bytes by orjson
+        self.fh = open(path, "ab", buffering=self.buffer_bytes)
         self.opened_at = time.time()
         self.last_fsync = self.opened_at
 
@@ -112,19 +134,56 @@ class JsonlRotatingWriter:
         now = time.time()
 
         # Rotate file if the rotation interval has elapsed
-        if now - self.opened_at > self.rotate_seconds:
+        if self.rotate_seconds > 0 and now - self.opened_at > self.rotate_seconds:
             self._open_new()
 
-        # Write one JSON object per line (buffered)
-        self.fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # Write one JSON object per line (buffered). orjson appends the newline
+        # itself, so there is no second bytes object for the concatenation.
+        self.fh.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
 
         # Force data to disk periodically (not on every write).
         # We flush BEFORE fsync so the OS sees the latest bytes.
         if now - self.last_fsync > self.fsync_seconds:
             self.fh.flush()
-            os.fsync(self.fh.fileno())
+            _fdatasync(self.fh.fileno())
             self.last_fsync = now
 
+    def write_many(self, records) -> None:
+        """
+        Append a batch of records through the file's write buffer.
+
+        Same rotation/fsync policy as write(), evaluated once for the batch
+        (a batch never straddles two part files). Lines go to writelines()
+        one by one rather than being joined first, so the batch is never
+        materialized as one large bytes object.
+        """
+        if not records:
+            return
+
+        now = time.time()
+
+        if self.rotate_seconds > 0 and now - self.opened_at > self.rotate_seconds:
+            self._open_new()
+
+        dumps = orjson.dumps
+        opt = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        self.fh.writelines(dumps(r, option=opt) for r in records)
+
+        if now - self.last_fsync > self.fsync_seconds:
+            self.fh.flush()
+            _fdatasync(self.fh.fileno())
+            self.last_fsync = now
+
+    def flush(self) -> None:
+        """
+        Push buffered records to the OS (no fsync) so readers see them.
+
+        For long-lived writers with infrequent writes, where the next
+        write()-driven fsync may be a long way off.
+        """
+        if self.fh:
+            self.fh.flush()
+
     def close(self):
         """
         Flush, fsync, and close the active file handle.
@@ -134,7 +193,7 @@ class JsonlRotatingWriter:
         if self.fh:
             try:
                 self.fh.flush()
-                os.fsync(self.fh.fileno())
+                _fdatasync(self.fh.fileno())
             finally:
                 self.fh.close()
                 self.fh = None
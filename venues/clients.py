@@ -0,0 +1,24 @@
+"""
+Shared venue client instances.
+
+Entry points get their venue clients from here instead of constructing them
+at import time, so every module in one process shares a single client (and
+its per-thread HTTP sessions / connection pools) per venue.
+"""
+
+from functools import lru_cache
+
+from venues.limitless.client import LimitlessVenueClient
+from venues.polymarket.client import PolymarketClient
+
+
+@lru_cache(maxsize=None)
+def limitless() -> LimitlessVenueClient:
+    """Process-wide LimitlessVenueClient."""
+    return LimitlessVenueClient()
+
+
+@lru_cache(maxsize=None)
+def polymarket() -> PolymarketClient:
+    """Process-wide PolymarketClient."""
+    return PolymarketClient()
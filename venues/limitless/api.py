@@ -82,6 +82,11 @@ class LimitlessAPI:
         if not underlying:
             return markets
 
+        return self.filter_markets(markets, underlying)
+
+    @staticmethod
+    def filter_markets(markets: list[dict], underlying: str) -> list[dict]:
+        """Keep the markets whose ticker or title mentions the underlying."""
         symbol = underlying.upper()
         filtered: list[dict] = []
         for market in markets:
@@ -95,12 +100,22 @@ class LimitlessAPI:
 
         return filtered
 
-    def discover_markets(self, underlying: str) -> list[LimitlessMarket]:
+    def discover_markets(
+        self,
+        underlying: str,
+        active_markets: list[dict] | None = None,
+    ) -> list[LimitlessMarket]:
         """
         Fetch and normalize markets for one underlying.
         Returns a filtered list of loggable markets capped by settings.
+
+        active_markets: an already-fetched list_markets() result to filter instead of
+        refetching markets/active (it is the same payload for every underlying).
         """
-        raw_markets = self.list_markets(underlying)
+        if active_markets is None:
+            raw_markets = self.list_markets(underlying)
+        else:
+            raw_markets = self.filter_markets(active_markets, underlying)
         markets = [
             LimitlessMarket.from_api({**m, "underlying": underlying})
             for m in raw_markets
@@ -9,11 +9,17 @@ IMPORTANT:
 - It forwards calls verbatim to existing code.
 """
 
+from itertools import chain
 from typing import Any, Dict, List 
 from venues.limitless.api import LimitlessAPI
 from venues.limitless.market import LimitlessMarket
 
 
+# Discovery filter constants (hoisted out of the per-market loop).
+_REQUIRED_TRADE = "clob"
+_ALLOWED_STATUS = frozenset(("FUNDED", "ACTIVE"))  # keep FUNDED at least
+
+
 class LimitlessVenueClient:
     venue = "limitless"
 
@@ -53,36 +59,40 @@ class LimitlessVenueClient:
         Polymarket's discovery interface.
         """
         instruments: list[dict] = []
-
-        for u in rules:
-            markets = self.discover_markets(u)
-
-            for m in markets:
-                raw = m.raw or {}
-
-                # Only include markets that actually have an orderbook
-                if raw.get("tradeType") != "clob":
-                    continue
-                if not raw.get("tokens"):
-                    continue
-                if raw.get("expired") is True:
-                    continue
-                if raw.get("status") not in ("FUNDED", "ACTIVE"):  # keep FUNDED at least
-                    continue
-
-                instruments.append(
-                    {
-                        "venue": "limitless",
-                        "market_id": m.market_id,
-                        "instrument_id": "BOOK",
-                        "poll_key": m.slug,
-                        "slug": m.slug,
-                        "underlying": m.underlying,
-                        "expiration": raw.get("expirationTimestamp"),
-                        "title": getattr(m, "title", None),
-                        "raw": raw,
-                    }
-                )
+        if not rules:
+            return instruments
+
+        # markets/active is the same payload for every underlying: fetch it
+        # once per call and filter it per underlying locally.
+        active = self.api.list_markets()
+        per_underlying = (self.api.discover_markets(u, active_markets=active) for u in rules)
+
+        for m in chain.from_iterable(per_underlying):
+            raw = m.raw or {}
+
+            # Only include markets that actually have an orderbook
+            # (tradeType first: it rejects most markets before the other checks)
+            if (
+                raw.get("tradeType") != _REQUIRED_TRADE
+                or not raw.get("tokens")
+                or raw.get("expired") is True
+                or raw.get("status") not in _ALLOWED_STATUS
+            ):
+                continue
+
+            instruments.append(
+                {
+                    "venue": "limitless",
+                    "market_id": m.market_id,
+                    "instrument_id": "BOOK",
+                    "poll_key": m.slug,
+                    "slug": m.slug,
+                    "underlying": m.underlying,
+                    "expiration": raw.get("expirationTimestamp"),
+                    "title": getattr(m, "title", None),
+                    "raw": raw,
+                }
+            )
 
         return instruments
 
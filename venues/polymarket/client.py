@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import httpx
 import threading
@@ -6,6 +7,7 @@ import threading
 from config.settings import settings
 
 PUBIC_SEARCH_LIMIT = 1000
+SEARCH_MAX_WORKERS = 16  # concurrent public-search requests during discovery
 GAMMA_BASE = "https://gamma-api.polymarket.com"
 CLOB_BASE = "https://clob.polymarket.com"
 
@@ -24,6 +26,14 @@ class PolymarketClient:
         # This avoids shared connection pool issues under multithreading.
         self._tls = threading.local()
 
+        # Long-lived pool for public-search fan-out. Reusing the same worker
+        # threads keeps their thread-local httpx.Clients (and connections)
+        # alive across discovery cycles. Threads are only spawned on first use.
+        self._search_pool = ThreadPoolExecutor(
+            max_workers=SEARCH_MAX_WORKERS,
+            thread_name_prefix="poly-search",
+        )
+
     def _http(self) -> httpx.Client:
         """
         Return a per-thread httpx.Client instance.
@@ -198,6 +208,22 @@ class PolymarketClient:
         # closed=false is safe for “active snapshot” discovery.
         gamma_params = {"closed": False}
 
+        # Precompile rule matchers once per call instead of per market:
+        # prefixes as a tuple (single C-level str.startswith), recurrence as a frozenset.
+        compiled_rules = [
+            (
+                rule,
+                tuple(rule.get("series_slug_prefixes") or ()),
+                frozenset(rule.get("allowed_recurrence") or ()),
+                rule.get("min_minutes_to_expiry", float("-inf")),
+                rule.get("max_minutes_to_expiry", float("inf")),
+                int(rule.get("lead_ms", 60_000)),
+                rule.get("start_time_fields", ["eventStartTime", "startTime"]),
+            )
+            for rule in rules
+            if rule.get("mode") == "crypto_markets"
+        ]
+
         for d in self.list_markets_paginated(limit=200, gamma_params=gamma_params):
             # ----- hard filters -----
             # hard filters: tradable now
@@ -225,27 +251,17 @@ class PolymarketClient:
             minutes = self._minutes_to_expiry(end_ms)
 
             # match a rule (crypto-style rule shape)
-            for rule in rules:
-                if rule.get("mode") != "crypto_markets":
-                    continue
-
-                prefixes = rule.get("series_slug_prefixes") or []
-                allowed = set(rule.get("allowed_recurrence") or [])
-
-                if prefixes and not any(series_slug.startswith(p) for p in prefixes):
+            for rule, prefixes, allowed, min_m, max_m, lead_ms, start_fields in compiled_rules:
+                if prefixes and not series_slug.startswith(prefixes):
                     continue
                 if allowed and recurrence not in allowed:
                     continue
 
                 # expiry window
-                min_m = rule.get("min_minutes_to_expiry", float("-inf"))
-                max_m = rule.get("max_minutes_to_expiry", float("inf"))
                 if minutes < min_m or minutes > max_m:
                     continue
 
                 # active window check (optional but you already use it)
-                lead_ms = int(rule.get("lead_ms", 60_000))
-                start_fields = rule.get("start_time_fields", ["eventStartTime", "startTime"])
                 start_ms = _get_start_ms(d, start_fields)
                 if start_ms is None:
                     continue
@@ -346,14 +362,24 @@ class PolymarketClient:
         # -----------------------------------------------------------------
         slug_to_rule_idxs: dict[str, set[int]] = {}
 
+        # Rules often share query strings: search each unique query once and
+        # fan its slugs out to every rule that asked for it.
+        query_to_rule_idxs: dict[str, list[int]] = {}
         for ridx, rule in enumerate(rules):
-            for q in rule.get("queries", []) or []:
-                blob = self.public_search(q)
+            for q in (rule.get("queries", []) or []):
+                query_to_rule_idxs.setdefault(q, []).append(ridx)
+        queries = list(query_to_rule_idxs)
+
+        # Searches are independent network round-trips: overlap them
+        # (self.http is per-thread, so each worker gets its own httpx.Client).
+        blobs = list(self._search_pool.map(self.public_search, queries))
 
-                found: set[str] = set()
-                self._collect_market_slugs(blob, found)
-                for slug in found:
-                    slug_to_rule_idxs.setdefault(slug, set()).add(ridx)
+        for q, blob in zip(queries, blobs):
+            found: set[str] = set()
+            self._collect_market_slugs(blob, found)
+            ridxs = query_to_rule_idxs[q]
+            for slug in found:
+                slug_to_rule_idxs.setdefault(slug, set()).update(ridxs)
 
         out: list[dict] = []
 
@@ -467,9 +493,11 @@ class PolymarketClient:
 
     def close(self) -> None:
         """
-        Best-effort cleanup: close this thread's client if it exists.
+        Best-effort cleanup: stop the search pool and close this thread's
+        client if it exists.
         Note: other threads will have their own clients.
         """
+        self._search_pool.shutdown(wait=True)
         c = getattr(self._tls, "client", None)
         if c is not None:
             try: